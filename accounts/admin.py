@@ -4,9 +4,50 @@ Provides admin interface for managing accounts and transactions
 """
 
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
 from .models import SavingsAccount, CurrentAccount, Transaction, CustomerProfile
 
 
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that uses PostgreSQL's row estimate for unfiltered lists.
+    Avoids a full COUNT(*) on large tables; other databases count normally.
+    """
+    
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, 'query', None)
+        if query is None or query.where:
+            return super().count
+        
+        # Ask the database the queryset is routed to, not the default one
+        connection = connections[self.object_list.db]
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                    [self.object_list.model._meta.db_table]
+                )
+                row = cursor.fetchone()
+            # reltuples is -1 (or 0) until the table has been analyzed
+            if row and row[0] > 0:
+                return row[0]
+        return super().count
+
+
+class TransactionChangeList(ChangeList):
+    """Changelist that loads only the columns shown in the transaction list"""
+    
+    def get_queryset(self, request, exclude_parameters=None):
+        return super().get_queryset(request, exclude_parameters).only(
+            'transaction_id', 'transaction_type', 'amount', 'balance_after', 'timestamp',
+            'account__account_number', 'account__account_type'
+        )
+
+
 @admin.register(CustomerProfile)
 class CustomerProfileAdmin(admin.ModelAdmin):
     """Admin interface for Customer Profiles"""
@@ -38,8 +79,10 @@ class SavingsAccountAdmin(admin.ModelAdmin):
     
     list_display = ['account_number', 'customer', 'balance', 'is_active', 'created_at']
     list_filter = ['is_active', 'created_at']
+    list_select_related = ['customer']
     search_fields = ['account_number', 'customer__username', 'customer__email']
-    readonly_fields = ['account_number', 'created_at', 'updated_at']
+    # account_type is set by the proxy model and decides which admin lists the row
+    readonly_fields = ['account_number', 'account_type', 'created_at', 'updated_at']
     
     fieldsets = (
         ('Account Information', {
@@ -57,9 +100,9 @@ class SavingsAccountAdmin(admin.ModelAdmin):
     )
     
     def get_readonly_fields(self, request, obj=None):
-        """Make account_number readonly after creation"""
+        """Make customer readonly after creation"""
         if obj:  # Editing existing object
-            return self.readonly_fields + ['customer', 'account_type']
+            return self.readonly_fields + ['customer']
         return self.readonly_fields
 
 
@@ -69,8 +112,10 @@ class CurrentAccountAdmin(admin.ModelAdmin):
     
     list_display = ['account_number', 'customer', 'balance', 'is_active', 'created_at']
     list_filter = ['is_active', 'created_at']
+    list_select_related = ['customer']
     search_fields = ['account_number', 'customer__username', 'customer__email']
-    readonly_fields = ['account_number', 'created_at', 'updated_at']
+    # account_type is set by the proxy model and decides which admin lists the row
+    readonly_fields = ['account_number', 'account_type', 'created_at', 'updated_at']
     
     fieldsets = (
         ('Account Information', {
@@ -89,9 +134,9 @@ class CurrentAccountAdmin(admin.ModelAdmin):
     )
     
     def get_readonly_fields(self, request, obj=None):
-        """Make account_number readonly after creation"""
+        """Make customer readonly after creation"""
         if obj:  # Editing existing object
-            return self.readonly_fields + ['customer', 'account_type']
+            return self.readonly_fields + ['customer']
         return self.readonly_fields
 
 
@@ -100,14 +145,17 @@ class TransactionAdmin(admin.ModelAdmin):
     """Admin interface for Transactions"""
     
     list_display = ['transaction_id', 'get_account', 'transaction_type', 'amount', 'balance_after', 'timestamp']
-    list_filter = ['transaction_type', 'timestamp']
-    search_fields = ['transaction_id', 'account__account_number', 'current_account__account_number']
+    # DateFieldListFilter instead of date_hierarchy, which scans the whole table for distinct dates
+    list_filter = ['transaction_type', ('timestamp', admin.DateFieldListFilter)]
+    list_select_related = ['account']
+    search_fields = ['transaction_id', 'account__account_number']
     readonly_fields = ['transaction_id', 'timestamp']
-    date_hierarchy = 'timestamp'
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     
     fieldsets = (
         ('Transaction Information', {
-            'fields': ('transaction_id', 'account', 'current_account', 'transaction_type')
+            'fields': ('transaction_id', 'account', 'transaction_type')
         }),
         ('Amount Details', {
             'fields': ('amount', 'balance_after')
@@ -124,12 +172,18 @@ class TransactionAdmin(admin.ModelAdmin):
         """Display account number in list"""
         if obj.account:
             return obj.account.account_number
-        elif obj.current_account:
-            return obj.current_account.account_number
         return "N/A"
     
     get_account.short_description = 'Account Number'
     
+    def get_queryset(self, request):
+        """Join the account, which every transaction view displays"""
+        return super().get_queryset(request).select_related('account')
+    
+    def get_changelist(self, request, **kwargs):
+        """Narrow the columns on the list page only; detail views need them all"""
+        return TransactionChangeList
+    
     def has_add_permission(self, request):
         """Disable manual transaction creation from admin"""
         return False
@@ -5,8 +5,13 @@ Banking System Forms - Input Validation and User Interface
 from django import forms
 from django.contrib.auth.models import User
 from django.contrib.auth.forms import UserCreationForm
-from .models import CustomerProfile, SavingsAccount, CurrentAccount
+from .models import CustomerProfile, Account
 from datetime import date
+import re
+
+
+# Phone numbers: digits only, 10 to 15 characters
+PHONE_RE = re.compile(r'\d{10,15}')
 
 
 class RegistrationForm(UserCreationForm):
@@ -121,10 +126,8 @@ class RegistrationForm(UserCreationForm):
     def clean_phone(self):
         """Validate phone number"""
         phone = self.cleaned_data.get('phone')
-        if not phone.isdigit():
-            raise forms.ValidationError("Phone number must contain only digits.")
-        if len(phone) < 10:
-            raise forms.ValidationError("Phone number must be at least 10 digits.")
+        if not PHONE_RE.fullmatch(phone):
+            raise forms.ValidationError("Phone number must be 10 to 15 digits.")
         return phone
     
     def clean_date_of_birth(self):
@@ -295,26 +298,33 @@ class TransferForm(forms.Form):
         })
     )
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._to_account = None
+    
     def clean_to_account(self):
         """Validate recipient account exists"""
         account_number = self.cleaned_data.get('to_account')
         
-        # Check in both account types
-        savings_exists = SavingsAccount.objects.filter(
-            account_number=account_number,
-            is_active=True
-        ).exists()
-        
-        current_exists = CurrentAccount.objects.filter(
-            account_number=account_number,
-            is_active=True
-        ).exists()
-        
-        if not (savings_exists or current_exists):
+        # Keep the resolved account so the view does not have to query it again
+        try:
+            self._to_account = Account.objects.get(
+                account_number=account_number,
+                is_active=True
+            )
+        except Account.DoesNotExist:
             raise forms.ValidationError("Invalid account number or account not active.")
         
         return account_number
     
+    def get_to_account(self):
+        """
+        Return the recipient account resolved during validation.
+        Only meaningful after is_valid(); None if the form was not validated
+        or the recipient account was invalid.
+        """
+        return self._to_account
+    
     def clean(self):
         """Validate that from and to accounts are different"""
         cleaned_data = super().clean()
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-15 06:45
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='currentaccount',
+            index=models.Index(fields=['customer', 'is_active'], name='accounts_cu_custome_b2ae18_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='savingsaccount',
+            index=models.Index(fields=['customer', 'is_active'], name='accounts_sa_custome_d34b81_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['-timestamp'], name='accounts_tr_timesta_5232e4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['savings_account', '-timestamp'], name='accounts_tr_savings_548e0d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['current_account', '-timestamp'], name='accounts_tr_current_e696ab_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['transaction_type'], name='accounts_tr_transac_9f7758_idx'),
+        ),
+    ]
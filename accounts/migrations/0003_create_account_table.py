@@ -0,0 +1,46 @@
+import django.core.validators
+import django.db.models.deletion
+from decimal import Decimal
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    Step 1 of merging SavingsAccount/CurrentAccount into one Account table:
+    create the table and a nullable Transaction.account column.
+    Data is copied in 0004 and the old tables are dropped in 0005, each in its
+    own migration so schema changes never share a transaction with row updates.
+    """
+
+    dependencies = [
+        ('accounts', '0002_add_query_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Account',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('account_number', models.CharField(editable=False, max_length=12, unique=True)),
+                ('account_type', models.CharField(choices=[('SAVINGS', 'Savings Account'), ('CURRENT', 'Current Account')], max_length=10)),
+                ('balance', models.DecimalField(decimal_places=2, default=0.0, max_digits=12, validators=[django.core.validators.MinValueValidator(Decimal('0.00'))])),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('customer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='accounts', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Account',
+                'verbose_name_plural': 'Accounts',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['customer', 'account_type', 'is_active'], name='accounts_ac_custome_e55237_idx')],
+            },
+        ),
+        migrations.AddField(
+            model_name='transaction',
+            name='account',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='transactions', to='accounts.account'),
+        ),
+    ]
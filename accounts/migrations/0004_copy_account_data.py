@@ -0,0 +1,65 @@
+from django.db import migrations
+
+
+ACCOUNT_COLUMNS = 'account_number, balance, is_active, created_at, updated_at, customer_id'
+
+# (old table, old Transaction FK column, account_type stored in accounts_account)
+OLD_ACCOUNT_TABLES = [
+    ('accounts_savingsaccount', 'savings_account_id', 'SAVINGS'),
+    ('accounts_currentaccount', 'current_account_id', 'CURRENT'),
+]
+
+
+def copy_forward():
+    """INSERT ... SELECT each old table, then re-point its transactions"""
+    statements = []
+    for table, fk_column, account_type in OLD_ACCOUNT_TABLES:
+        statements += [
+            f"INSERT INTO accounts_account (account_type, {ACCOUNT_COLUMNS}) "
+            f"SELECT '{account_type}', {ACCOUNT_COLUMNS} FROM {table}",
+            f"UPDATE accounts_transaction SET account_id = ("
+            f"SELECT a.id FROM accounts_account a "
+            f"INNER JOIN {table} old ON old.account_number = a.account_number "
+            f"WHERE old.id = accounts_transaction.{fk_column} "
+            f"AND a.account_type = '{account_type}'"
+            f") WHERE {fk_column} IS NOT NULL",
+        ]
+    return statements
+
+
+def copy_backward():
+    """Copy accounts back into the re-created per-type tables and empty Account"""
+    statements = []
+    for table, fk_column, account_type in OLD_ACCOUNT_TABLES:
+        statements += [
+            f"INSERT INTO {table} (account_type, {ACCOUNT_COLUMNS}) "
+            f"SELECT account_type, {ACCOUNT_COLUMNS} FROM accounts_account "
+            f"WHERE account_type = '{account_type}'",
+            f"UPDATE accounts_transaction SET {fk_column} = ("
+            f"SELECT old.id FROM {table} old "
+            f"INNER JOIN accounts_account a ON a.account_number = old.account_number "
+            f"WHERE a.id = accounts_transaction.account_id"
+            f") WHERE account_id IN ("
+            f"SELECT id FROM accounts_account WHERE account_type = '{account_type}')",
+        ]
+    statements += [
+        "UPDATE accounts_transaction SET account_id = NULL",
+        "DELETE FROM accounts_account",
+    ]
+    return statements
+
+
+class Migration(migrations.Migration):
+    """
+    Step 2 of the Account table merge: copy rows only, no schema changes.
+    Keeping this separate from 0005 avoids PostgreSQL's "pending trigger
+    events" error when a table is altered after rows in it were updated.
+    """
+
+    dependencies = [
+        ('accounts', '0003_create_account_table'),
+    ]
+
+    operations = [
+        migrations.RunSQL(copy_forward(), copy_backward()),
+    ]
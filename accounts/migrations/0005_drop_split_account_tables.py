@@ -0,0 +1,71 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    Step 3 of the Account table merge: drop the per-type tables and FKs,
+    make Transaction.account required and turn the account types into proxies.
+    """
+
+    dependencies = [
+        ('accounts', '0004_copy_account_data'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='transaction',
+            name='accounts_tr_savings_548e0d_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='transaction',
+            name='accounts_tr_current_e696ab_idx',
+        ),
+        migrations.RemoveField(
+            model_name='transaction',
+            name='savings_account',
+        ),
+        migrations.RemoveField(
+            model_name='transaction',
+            name='current_account',
+        ),
+        migrations.AlterField(
+            model_name='transaction',
+            name='account',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='transactions', to='accounts.account'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['account', '-timestamp'], name='accounts_tr_account_7c63f7_idx'),
+        ),
+        migrations.DeleteModel(
+            name='SavingsAccount',
+        ),
+        migrations.DeleteModel(
+            name='CurrentAccount',
+        ),
+        migrations.CreateModel(
+            name='SavingsAccount',
+            fields=[],
+            options={
+                'verbose_name': 'Savings Account',
+                'verbose_name_plural': 'Savings Accounts',
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('accounts.account',),
+        ),
+        migrations.CreateModel(
+            name='CurrentAccount',
+            fields=[],
+            options={
+                'verbose_name': 'Current Account',
+                'verbose_name_plural': 'Current Accounts',
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('accounts.account',),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-15 06:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_drop_split_account_tables'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='customerprofile',
+            name='identity_number',
+            field=models.CharField(db_index=True, max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='customerprofile',
+            name='phone',
+            field=models.CharField(db_index=True, max_length=15),
+        ),
+    ]
@@ -2,28 +2,42 @@
 Banking System Models - OOP Implementation (FINAL VERSION)
 Demonstrates: Inheritance, Encapsulation, Polymorphism, Abstraction
 
-✅ FIXED: Related name conflicts resolved
-✅ Each account type has unique related_name
+✅ All accounts share one table; account types are proxy models
 """
 
-from django.db import models
+from django.db import models, IntegrityError, transaction as db_transaction
+from django.db.models import F, Sum
+from django.db.models.functions import Round
 from django.contrib.auth.models import User
 from django.core.validators import MinValueValidator
+from django.utils import timezone
 from decimal import Decimal
-import random
-import string
+import secrets
 
 
 # ============================================================================
 # BASE CLASS - Demonstrates ABSTRACTION and ENCAPSULATION
 # ============================================================================
 
+class AccountTypeManager(models.Manager):
+    """Manager that limits a proxy account model to its own account type"""
+    
+    def __init__(self, account_type):
+        super().__init__()
+        self.account_type = account_type
+    
+    def get_queryset(self):
+        return super().get_queryset().filter(account_type=self.account_type)
+
+
 class Account(models.Model):
     """
-    Abstract Base Class for all bank accounts.
+    Base Class for all bank accounts.
     Demonstrates: Abstraction, Encapsulation
     
-    NOTE: customer field is defined in child classes to avoid related_name conflicts
+    NOTE: All account types are stored in this table and told apart by
+    account_type. Rows are loaded as the matching proxy class, so deposit()
+    and withdraw() dispatch polymorphically.
     """
     
     # Account Types (used by child classes)
@@ -35,7 +49,15 @@ class Account(models.Model):
         (CURRENT, 'Current Account'),
     ]
     
+    # Number of account numbers to try before giving up on a collision
+    ACCOUNT_NUMBER_ATTEMPTS = 5
+    
     # Encapsulated attributes
+    customer = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='accounts'
+    )
     account_number = models.CharField(max_length=12, unique=True, editable=False)
     account_type = models.CharField(max_length=10, choices=ACCOUNT_TYPE_CHOICES)
     balance = models.DecimalField(
@@ -49,12 +71,37 @@ class Account(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
-        abstract = True  # Makes this an abstract base class
         ordering = ['-created_at']
+        verbose_name = 'Account'
+        verbose_name_plural = 'Accounts'
+        indexes = [
+            models.Index(fields=['customer', 'account_type', 'is_active']),
+        ]
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Assign the account number once, when a new account is built
+        if not self.pk and not self.account_number:
+            self.account_number = self.generate_account_number()
     
     def __str__(self):
         return f"{self.account_type} - {self.account_number}"
     
+    @classmethod
+    def get_account_class(cls, account_type):
+        """Return the proxy class that implements the given account type"""
+        return {
+            cls.SAVINGS: SavingsAccount,
+            cls.CURRENT: CurrentAccount,
+        }.get(account_type, Account)
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Load generic Account rows as their concrete account type"""
+        if cls is Account and 'account_type' in field_names:
+            cls = cls.get_account_class(values[field_names.index('account_type')])
+        return super(Account, cls).from_db(db, field_names, values)
+    
     # ========== ENCAPSULATION: Getter and Setter Methods ==========
     
     def get_balance(self):
@@ -66,7 +113,7 @@ class Account(models.Model):
         if amount < 0:
             raise ValueError("Balance cannot be negative")
         self.balance = amount
-        self.save()
+        self.save(update_fields=['balance', 'updated_at'])
     
     # ========== ABSTRACTION: Interface Methods ==========
     
@@ -93,16 +140,38 @@ class Account(models.Model):
     
     # ========== HELPER METHODS ==========
     
+    def change_balance(self, delta, **conditions):
+        """
+        Add delta to the balance in SQL and reload the result.
+        Extra lookups guard the UPDATE; returns False if they did not match.
+        """
+        updated = Account.objects.filter(pk=self.pk, **conditions).update(
+            balance=F('balance') + delta,
+            updated_at=timezone.now()
+        )
+        if updated:
+            self.refresh_from_db(fields=['balance', 'updated_at'])
+        return bool(updated)
+    
     @staticmethod
     def generate_account_number():
         """Generate unique 12-digit account number"""
-        return ''.join(random.choices(string.digits, k=12))
+        return str(secrets.randbelow(10**12)).zfill(12)
     
     def save(self, *args, **kwargs):
-        """Override save to auto-generate account number"""
-        if not self.account_number:
-            self.account_number = self.generate_account_number()
-        super().save(*args, **kwargs)
+        """Override save to retry account number collisions on insert"""
+        if not self._state.adding:
+            return super().save(*args, **kwargs)
+        
+        # Retry with a fresh number if the unique constraint reports a collision
+        for attempt in range(self.ACCOUNT_NUMBER_ATTEMPTS):
+            try:
+                with db_transaction.atomic():
+                    return super().save(*args, **kwargs)
+            except IntegrityError:
+                if attempt == self.ACCOUNT_NUMBER_ATTEMPTS - 1:
+                    raise
+                self.account_number = self.generate_account_number()
 
 
 # ============================================================================
@@ -114,15 +183,10 @@ class SavingsAccount(Account):
     Savings Account - Inherits from Account base class.
     Demonstrates: Inheritance, Polymorphism
     
-    ✅ FIXED: Uses unique related_name='savings_accounts'
+    Proxy model: stored in the shared Account table with account_type=SAVINGS
     """
     
-    # Customer field with UNIQUE related_name
-    customer = models.ForeignKey(
-        User, 
-        on_delete=models.CASCADE, 
-        related_name='savings_accounts'  # ✅ Unique related name
-    )
+    objects = AccountTypeManager(Account.SAVINGS)
     
     # Class-level constants (encapsulation)
     MINIMUM_BALANCE = Decimal('500.00')
@@ -130,6 +194,7 @@ class SavingsAccount(Account):
     WITHDRAWAL_LIMIT = Decimal('50000.00')  # Daily limit
     
     class Meta:
+        proxy = True
         verbose_name = 'Savings Account'
         verbose_name_plural = 'Savings Accounts'
     
@@ -139,6 +204,7 @@ class SavingsAccount(Account):
     
     # ========== POLYMORPHISM: Override parent methods ==========
     
+    @db_transaction.atomic
     def deposit(self, amount):
         """
         Deposit money - Savings specific implementation.
@@ -147,12 +213,11 @@ class SavingsAccount(Account):
         if amount <= 0:
             raise ValueError("Deposit amount must be positive")
         
-        self.balance += Decimal(str(amount))
-        self.save()
+        self.change_balance(Decimal(str(amount)))
         
         # Create transaction record
         Transaction.objects.create(
-            savings_account=self,
+            account=self,
             transaction_type=Transaction.DEPOSIT,
             amount=amount,
             balance_after=self.balance,
@@ -161,6 +226,7 @@ class SavingsAccount(Account):
         
         return True
     
+    @db_transaction.atomic
     def withdraw(self, amount):
         """
         Withdraw money with savings account rules.
@@ -175,16 +241,13 @@ class SavingsAccount(Account):
         if amount > self.WITHDRAWAL_LIMIT:
             raise ValueError(f"Daily withdrawal limit is {self.WITHDRAWAL_LIMIT}")
         
-        if self.balance - amount < self.MINIMUM_BALANCE:
+        # Perform withdrawal only if the minimum balance is kept
+        if not self.change_balance(-amount, balance__gte=amount + self.MINIMUM_BALANCE):
             raise ValueError(f"Insufficient balance. Minimum balance required: {self.MINIMUM_BALANCE}")
         
-        # Perform withdrawal
-        self.balance -= amount
-        self.save()
-        
         # Create transaction record
         Transaction.objects.create(
-            savings_account=self,
+            account=self,
             transaction_type=Transaction.WITHDRAWAL,
             amount=amount,
             balance_after=self.balance,
@@ -199,9 +262,50 @@ class SavingsAccount(Account):
     
     def calculate_interest(self):
         """Calculate and add interest (savings-specific feature)"""
-        interest = self.balance * self.INTEREST_RATE / 12  # Monthly interest
-        self.deposit(interest)
-        return interest
+        credited = self.apply_monthly_interest(SavingsAccount.objects.filter(pk=self.pk))
+        self.refresh_from_db(fields=['balance', 'updated_at'])
+        return credited[0].amount if credited else Decimal('0.00')
+    
+    @classmethod
+    @db_transaction.atomic
+    def apply_monthly_interest(cls, accounts=None):
+        """
+        Credit one month of interest to active savings accounts in bulk.
+        Uses one UPDATE for all balances and one INSERT for the audit records.
+        Returns the interest transactions that were created.
+        """
+        if accounts is None:
+            accounts = cls.objects.all()
+        
+        # Lock the accounts and remember their balances before the credit
+        old_balances = dict(
+            accounts.filter(is_active=True, balance__gt=0)
+            .select_for_update()
+            .values_list('pk', 'balance')
+        )
+        if not old_balances:
+            return []
+        
+        credited = cls.objects.filter(pk__in=old_balances)
+        credited.update(
+            balance=F('balance') + Round(F('balance') * (cls.INTEREST_RATE / 12), 2),
+            updated_at=timezone.now()
+        )
+        
+        interest_txns = [
+            Transaction(
+                account_id=pk,
+                transaction_type=Transaction.DEPOSIT,
+                amount=balance - old_balances[pk],
+                balance_after=balance,
+                description=f"Monthly interest credit to {account_number}"
+            )
+            for pk, balance, account_number in credited.values_list(
+                'pk', 'balance', 'account_number'
+            )
+            if balance > old_balances[pk]
+        ]
+        return Transaction.bulk_record(interest_txns)
 
 
 class CurrentAccount(Account):
@@ -209,15 +313,10 @@ class CurrentAccount(Account):
     Current Account - Inherits from Account base class.
     Demonstrates: Inheritance, Polymorphism
     
-    ✅ FIXED: Uses unique related_name='current_accounts'
+    Proxy model: stored in the shared Account table with account_type=CURRENT
     """
     
-    # Customer field with UNIQUE related_name
-    customer = models.ForeignKey(
-        User, 
-        on_delete=models.CASCADE, 
-        related_name='current_accounts'  # ✅ Unique related name
-    )
+    objects = AccountTypeManager(Account.CURRENT)
     
     # Class-level constants (different from SavingsAccount)
     MINIMUM_BALANCE = Decimal('1000.00')
@@ -225,6 +324,7 @@ class CurrentAccount(Account):
     TRANSACTION_FEE = Decimal('10.00')
     
     class Meta:
+        proxy = True
         verbose_name = 'Current Account'
         verbose_name_plural = 'Current Accounts'
     
@@ -234,6 +334,7 @@ class CurrentAccount(Account):
     
     # ========== POLYMORPHISM: Different implementation than SavingsAccount ==========
     
+    @db_transaction.atomic
     def deposit(self, amount):
         """
         Deposit money - Current account specific implementation.
@@ -242,11 +343,10 @@ class CurrentAccount(Account):
         if amount <= 0:
             raise ValueError("Deposit amount must be positive")
         
-        self.balance += Decimal(str(amount))
-        self.save()
+        self.change_balance(Decimal(str(amount)))
         
         Transaction.objects.create(
-            current_account=self,
+            account=self,
             transaction_type=Transaction.DEPOSIT,
             amount=amount,
             balance_after=self.balance,
@@ -255,6 +355,7 @@ class CurrentAccount(Account):
         
         return True
     
+    @db_transaction.atomic
     def withdraw(self, amount):
         """
         Withdraw money with current account rules (allows overdraft).
@@ -265,33 +366,28 @@ class CurrentAccount(Account):
         if amount <= 0:
             raise ValueError("Withdrawal amount must be positive")
         
-        # Current account allows overdraft
-        if self.balance - amount < -self.OVERDRAFT_LIMIT:
-            raise ValueError(f"Overdraft limit exceeded. Limit: {self.OVERDRAFT_LIMIT}")
-        
-        # Deduct transaction fee
+        # Deduct amount plus transaction fee; current account allows overdraft
         total_deduction = amount + self.TRANSACTION_FEE
-        self.balance -= total_deduction
-        self.save()
+        if not self.change_balance(-total_deduction, balance__gte=amount - self.OVERDRAFT_LIMIT):
+            raise ValueError(f"Overdraft limit exceeded. Limit: {self.OVERDRAFT_LIMIT}")
         
-        # Create withdrawal transaction
-        Transaction.objects.create(
-            current_account=self,
+        withdrawal_txn = Transaction(
+            account=self,
             transaction_type=Transaction.WITHDRAWAL,
             amount=amount,
             balance_after=self.balance,
             description=f"Withdrawal from {self.account_number}"
         )
-        
-        # Create fee transaction
-        Transaction.objects.create(
-            current_account=self,
+        fee_txn = Transaction(
+            account=self,
             transaction_type=Transaction.FEE,
             amount=self.TRANSACTION_FEE,
             balance_after=self.balance,
             description="Transaction fee"
         )
         
+        Transaction.bulk_record([withdrawal_txn, fee_txn])
+        
         return True
     
     def get_minimum_balance(self):
@@ -308,7 +404,7 @@ class Transaction(models.Model):
     Transaction Model - Records all account transactions.
     Demonstrates: Encapsulation
     
-    ✅ UPDATED: Separate ForeignKey fields for each account type
+    ✅ UPDATED: Single ForeignKey to the shared Account table
     """
     
     DEPOSIT = 'DEPOSIT'
@@ -325,23 +421,16 @@ class Transaction(models.Model):
         (FEE, 'Fee'),
     ]
     
+    # Number of transaction IDs to try before giving up on a collision
+    TRANSACTION_ID_ATTEMPTS = 5
+    
     # Encapsulated attributes
     transaction_id = models.CharField(max_length=20, unique=True, editable=False)
     
-    # Separate ForeignKey fields for each account type
-    savings_account = models.ForeignKey(
-        'SavingsAccount', 
-        on_delete=models.CASCADE, 
-        related_name='transactions', 
-        null=True, 
-        blank=True
-    )
-    current_account = models.ForeignKey(
-        'CurrentAccount', 
-        on_delete=models.CASCADE, 
-        related_name='transactions', 
-        null=True, 
-        blank=True
+    account = models.ForeignKey(
+        Account,
+        on_delete=models.CASCADE,
+        related_name='transactions'
     )
     
     transaction_type = models.CharField(max_length=15, choices=TRANSACTION_TYPES)
@@ -354,27 +443,58 @@ class Transaction(models.Model):
         ordering = ['-timestamp']
         verbose_name = 'Transaction'
         verbose_name_plural = 'Transactions'
+        indexes = [
+            models.Index(fields=['-timestamp']),
+            models.Index(fields=['account', '-timestamp']),
+            models.Index(fields=['transaction_type']),
+        ]
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Assign the transaction ID once, when a new transaction is built
+        if not self.pk and not self.transaction_id:
+            self.transaction_id = self.generate_transaction_id()
     
     def __str__(self):
         return f"{self.transaction_type} - {self.amount} - {self.timestamp}"
     
-    @property
-    def account(self):
-        """Helper property to get the associated account"""
-        return self.savings_account or self.current_account
-    
     @staticmethod
     def generate_transaction_id():
         """Generate unique transaction ID"""
         prefix = 'TXN'
-        number = ''.join(random.choices(string.digits, k=10))
+        number = str(secrets.randbelow(10**10)).zfill(10)
         return f"{prefix}{number}"
     
     def save(self, *args, **kwargs):
-        """Override save to auto-generate transaction ID"""
-        if not self.transaction_id:
-            self.transaction_id = self.generate_transaction_id()
-        super().save(*args, **kwargs)
+        """Override save to retry transaction ID collisions on insert"""
+        if not self._state.adding:
+            return super().save(*args, **kwargs)
+        
+        # Retry with a fresh ID if the unique constraint reports a collision
+        for attempt in range(self.TRANSACTION_ID_ATTEMPTS):
+            try:
+                with db_transaction.atomic():
+                    return super().save(*args, **kwargs)
+            except IntegrityError:
+                if attempt == self.TRANSACTION_ID_ATTEMPTS - 1:
+                    raise
+                self.transaction_id = self.generate_transaction_id()
+    
+    @classmethod
+    def bulk_record(cls, transactions):
+        """
+        Insert several new transactions with one bulk_create.
+        Retries with fresh IDs on a collision, like save().
+        """
+        for attempt in range(cls.TRANSACTION_ID_ATTEMPTS):
+            try:
+                with db_transaction.atomic():
+                    return cls.objects.bulk_create(transactions)
+            except IntegrityError:
+                if attempt == cls.TRANSACTION_ID_ATTEMPTS - 1:
+                    raise
+                for txn in transactions:
+                    txn.transaction_id = cls.generate_transaction_id()
 
 
 # ============================================================================
@@ -388,11 +508,11 @@ class CustomerProfile(models.Model):
     """
     
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='profile')
-    phone = models.CharField(max_length=15)
+    phone = models.CharField(max_length=15, db_index=True)
     address = models.TextField()
     date_of_birth = models.DateField()
     identity_proof = models.CharField(max_length=50)  # Aadhaar/PAN/Passport
-    identity_number = models.CharField(max_length=50)
+    identity_number = models.CharField(max_length=50, db_index=True)
     created_at = models.DateTimeField(auto_now_add=True)
     
     class Meta:
@@ -404,9 +524,8 @@ class CustomerProfile(models.Model):
     
     def get_total_balance(self):
         """Calculate total balance across all accounts"""
-        # Use the correct related_names
-        savings = self.user.savings_accounts.filter(is_active=True)
-        current = self.user.current_accounts.filter(is_active=True)
-        
-        total = sum(acc.balance for acc in savings) + sum(acc.balance for acc in current)
-        return total
\ No newline at end of file
+        # Let the database do the summing instead of loading every account row
+        total = self.user.accounts.filter(is_active=True).aggregate(
+            total=Sum('balance')
+        )['total']
+        return total or Decimal('0.00')
\ No newline at end of file
@@ -1,3 +1,149 @@
+from decimal import Decimal
+
+from django.contrib.auth.models import User
 from django.test import TestCase
+from django.urls import reverse
+
+from .models import Account, SavingsAccount, CurrentAccount, Transaction
+
+
+class SavingsAccountWithdrawTests(TestCase):
+    """Minimum balance rules enforced by the guarded balance UPDATE"""
+
+    def setUp(self):
+        self.user = User.objects.create_user('saver', password='pass')
+        self.account = SavingsAccount.objects.create(customer=self.user, balance=Decimal('1000.00'))
+
+    def test_withdraw_down_to_minimum_balance_is_allowed(self):
+        self.account.withdraw(Decimal('500.00'))
+
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, SavingsAccount.MINIMUM_BALANCE)
+
+    def test_withdraw_one_paisa_below_minimum_balance_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.account.withdraw(Decimal('500.01'))
+
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal('1000.00'))
+
+    def test_rejected_withdrawal_leaves_account_unchanged(self):
+        count = self.account.transactions.count()
+
+        with self.assertRaises(ValueError):
+            self.account.withdraw(Decimal('900.00'))
+
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal('1000.00'))
+        self.assertEqual(self.account.transactions.count(), count)
+
+
+class CurrentAccountWithdrawTests(TestCase):
+    """Overdraft rules, including the per-withdrawal fee"""
+
+    def setUp(self):
+        self.user = User.objects.create_user('trader', password='pass')
+        self.account = CurrentAccount.objects.create(customer=self.user, balance=Decimal('0.00'))
+
+    def test_withdraw_up_to_overdraft_limit_is_allowed_and_charges_fee(self):
+        self.account.withdraw(CurrentAccount.OVERDRAFT_LIMIT)
+
+        self.account.refresh_from_db()
+        expected = -(CurrentAccount.OVERDRAFT_LIMIT + CurrentAccount.TRANSACTION_FEE)
+        self.assertEqual(self.account.balance, expected)
+        self.assertEqual(
+            list(self.account.transactions.order_by('pk').values_list('transaction_type', 'balance_after')),
+            [(Transaction.WITHDRAWAL, expected), (Transaction.FEE, expected)]
+        )
+
+    def test_withdraw_one_paisa_past_overdraft_limit_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.account.withdraw(CurrentAccount.OVERDRAFT_LIMIT + Decimal('0.01'))
+
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal('0.00'))
+
+    def test_rejected_withdrawal_leaves_account_unchanged(self):
+        self.account.deposit(Decimal('100.00'))
+        count = self.account.transactions.count()
+
+        with self.assertRaises(ValueError):
+            self.account.withdraw(Decimal('20000.00'))
+
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal('100.00'))
+        self.assertEqual(self.account.transactions.count(), count)
+
+
+class AccountPolymorphismTests(TestCase):
+    """Rows from the shared Account table load as their proxy class"""
+
+    def setUp(self):
+        self.user = User.objects.create_user('owner', password='pass')
+        self.savings = SavingsAccount.objects.create(customer=self.user, balance=Decimal('1000.00'))
+        self.current = CurrentAccount.objects.create(customer=self.user, balance=Decimal('1000.00'))
+
+    def test_generic_lookup_returns_proxy_class(self):
+        self.assertIs(type(Account.objects.get(pk=self.savings.pk)), SavingsAccount)
+        self.assertIs(type(Account.objects.get(pk=self.current.pk)), CurrentAccount)
+
+    def test_proxy_managers_only_return_their_own_type(self):
+        self.assertEqual(list(SavingsAccount.objects.all()), [self.savings])
+        self.assertEqual(list(CurrentAccount.objects.all()), [self.current])
+
+    def test_withdraw_dispatches_to_proxy_implementation(self):
+        account = Account.objects.get(pk=self.current.pk)
+        account.withdraw(Decimal('100.00'))
+
+        # Only current accounts charge a fee
+        self.assertEqual(account.balance, Decimal('890.00'))
+        self.assertTrue(account.transactions.filter(transaction_type=Transaction.FEE).exists())
+
+    def test_deposit_dispatches_to_proxy_implementation(self):
+        account = Account.objects.get(pk=self.savings.pk)
+        account.deposit(Decimal('250.00'))
+
+        self.assertEqual(account.balance, Decimal('1250.00'))
+        self.assertIs(type(account.transactions.get().account), SavingsAccount)
+
+
+class TransferViewTests(TestCase):
+    """Transfers relabel the right transaction rows"""
+
+    def setUp(self):
+        self.sender = User.objects.create_user('sender', password='pass')
+        self.recipient = User.objects.create_user('recipient', password='pass')
+        self.from_account = CurrentAccount.objects.create(customer=self.sender, balance=Decimal('2000.00'))
+        self.to_account = SavingsAccount.objects.create(customer=self.recipient, balance=Decimal('1000.00'))
+        self.client.force_login(self.sender)
+
+    def test_transfer_labels_withdrawal_not_fee(self):
+        response = self.client.post(
+            reverse('transfer_money', args=[self.from_account.account_number]),
+            {
+                'from_account': self.from_account.account_number,
+                'to_account': self.to_account.account_number,
+                'amount': '300.00',
+                'description': 'Rent',
+            }
+        )
+
+        self.assertRedirects(
+            response,
+            reverse('account_detail', args=[self.from_account.account_number]),
+            fetch_redirect_response=False
+        )
+
+        transfer_out = self.from_account.transactions.get(transaction_type=Transaction.TRANSFER_OUT)
+        self.assertEqual(transfer_out.amount, Decimal('300.00'))
+        fee = self.from_account.transactions.get(transaction_type=Transaction.FEE)
+        self.assertEqual(fee.amount, CurrentAccount.TRANSACTION_FEE)
+
+        transfer_in = self.to_account.transactions.get()
+        self.assertEqual(transfer_in.transaction_type, Transaction.TRANSFER_IN)
+        self.assertEqual(transfer_in.amount, Decimal('300.00'))
 
-# Create your tests here.
+        self.from_account.refresh_from_db()
+        self.to_account.refresh_from_db()
+        self.assertEqual(self.from_account.balance, Decimal('1690.00'))
+        self.assertEqual(self.to_account.balance, Decimal('1300.00'))
@@ -11,7 +11,7 @@ from django.db.models import Q
 from django.db import transaction as db_transaction
 from decimal import Decimal
 
-from .models import SavingsAccount, CurrentAccount, Transaction, CustomerProfile
+from .models import Account, SavingsAccount, CurrentAccount, Transaction, CustomerProfile
 from .forms import (
     RegistrationForm, AccountCreationForm, DepositForm, 
     WithdrawalForm, TransferForm, SearchAccountForm
@@ -93,12 +93,12 @@ def dashboard(request):
     total_balance = sum(acc.get_balance() for acc in savings_accounts)
     total_balance += sum(acc.get_balance() for acc in current_accounts)
     
-    # Get recent transactions
+    # Get recent transactions (description is not shown on the dashboard)
     recent_transactions = []
     for acc in savings_accounts:
-        recent_transactions.extend(acc.transactions.all()[:5])
+        recent_transactions.extend(acc.transactions.defer('description')[:5])
     for acc in current_accounts:
-        recent_transactions.extend(acc.transactions.all()[:5])
+        recent_transactions.extend(acc.transactions.defer('description')[:5])
     
     # Sort by timestamp
     recent_transactions.sort(key=lambda x: x.timestamp, reverse=True)
@@ -167,28 +167,19 @@ def account_detail(request, account_number):
     View detailed account information.
     Demonstrates OOP: Handles both account types polymorphically.
     """
-    # Try to find account in both types
-    account = None
-    
+    # Find account (loaded as its concrete account type)
     try:
-        account = SavingsAccount.objects.get(
+        account = Account.objects.get(
             account_number=account_number,
             customer=request.user,
             is_active=True
         )
-    except SavingsAccount.DoesNotExist:
-        try:
-            account = CurrentAccount.objects.get(
-                account_number=account_number,
-                customer=request.user,
-                is_active=True
-            )
-        except CurrentAccount.DoesNotExist:
-            messages.error(request, 'Account not found.')
-            return redirect('dashboard')
+    except Account.DoesNotExist:
+        messages.error(request, 'Account not found.')
+        return redirect('dashboard')
     
-    # Get transactions
-    transactions = account.transactions.all()[:20]
+    # Get transactions (description is only shown on the full history page)
+    transactions = account.transactions.defer('description')[:20]
     
     # Get minimum balance (polymorphic method)
     min_balance = account.get_minimum_balance()
@@ -213,23 +204,15 @@ def deposit_money(request, account_number):
     Demonstrates OOP: Uses polymorphic deposit method.
     """
     # Find account
-    account = None
     try:
-        account = SavingsAccount.objects.get(
+        account = Account.objects.get(
             account_number=account_number,
             customer=request.user,
             is_active=True
         )
-    except SavingsAccount.DoesNotExist:
-        try:
-            account = CurrentAccount.objects.get(
-                account_number=account_number,
-                customer=request.user,
-                is_active=True
-            )
-        except CurrentAccount.DoesNotExist:
-            messages.error(request, 'Account not found.')
-            return redirect('dashboard')
+    except Account.DoesNotExist:
+        messages.error(request, 'Account not found.')
+        return redirect('dashboard')
     
     if request.method == 'POST':
         form = DepositForm(request.POST)
@@ -263,23 +246,15 @@ def withdraw_money(request, account_number):
     Demonstrates OOP: Uses polymorphic withdraw method with different rules.
     """
     # Find account
-    account = None
     try:
-        account = SavingsAccount.objects.get(
+        account = Account.objects.get(
             account_number=account_number,
             customer=request.user,
             is_active=True
         )
-    except SavingsAccount.DoesNotExist:
-        try:
-            account = CurrentAccount.objects.get(
-                account_number=account_number,
-                customer=request.user,
-                is_active=True
-            )
-        except CurrentAccount.DoesNotExist:
-            messages.error(request, 'Account not found.')
-            return redirect('dashboard')
+    except Account.DoesNotExist:
+        messages.error(request, 'Account not found.')
+        return redirect('dashboard')
     
     if request.method == 'POST':
         form = WithdrawalForm(request.POST)
@@ -316,23 +291,15 @@ def transfer_money(request, account_number):
     Demonstrates: Database transactions and error handling.
     """
     # Find sender account
-    from_account = None
     try:
-        from_account = SavingsAccount.objects.get(
+        from_account = Account.objects.get(
             account_number=account_number,
             customer=request.user,
             is_active=True
         )
-    except SavingsAccount.DoesNotExist:
-        try:
-            from_account = CurrentAccount.objects.get(
-                account_number=account_number,
-                customer=request.user,
-                is_active=True
-            )
-        except CurrentAccount.DoesNotExist:
-            messages.error(request, 'Account not found.')
-            return redirect('dashboard')
+    except Account.DoesNotExist:
+        messages.error(request, 'Account not found.')
+        return redirect('dashboard')
     
     if request.method == 'POST':
         form = TransferForm(request.POST)
@@ -341,16 +308,8 @@ def transfer_money(request, account_number):
             amount = form.cleaned_data['amount']
             description = form.cleaned_data.get('description', 'Fund Transfer')
             
-            # Find recipient account
-            to_account = None
-            try:
-                to_account = SavingsAccount.objects.get(account_number=to_account_number, is_active=True)
-            except SavingsAccount.DoesNotExist:
-                try:
-                    to_account = CurrentAccount.objects.get(account_number=to_account_number, is_active=True)
-                except CurrentAccount.DoesNotExist:
-                    messages.error(request, 'Recipient account not found.')
-                    return redirect('transfer_money', account_number=account_number)
+            # Recipient account was already looked up by the form
+            to_account = form.get_to_account()
             
             # Perform transfer using database transaction
             try:
@@ -362,7 +321,10 @@ def transfer_money(request, account_number):
                     to_account.deposit(amount)
                     
                     # Update transaction descriptions
-                    last_withdrawal = from_account.transactions.latest('timestamp')
+                    # Filter by type: current account withdrawals also record a fee
+                    last_withdrawal = from_account.transactions.filter(
+                        transaction_type=Transaction.WITHDRAWAL
+                    ).latest('timestamp', 'pk')
                     last_withdrawal.description = f"Transfer to {to_account_number}: {description}"
                     last_withdrawal.transaction_type = Transaction.TRANSFER_OUT
                     last_withdrawal.save()
@@ -396,23 +358,15 @@ def transfer_money(request, account_number):
 def transaction_history(request, account_number):
     """View complete transaction history"""
     # Find account
-    account = None
     try:
-        account = SavingsAccount.objects.get(
+        account = Account.objects.get(
             account_number=account_number,
             customer=request.user,
             is_active=True
         )
-    except SavingsAccount.DoesNotExist:
-        try:
-            account = CurrentAccount.objects.get(
-                account_number=account_number,
-                customer=request.user,
-                is_active=True
-            )
-        except CurrentAccount.DoesNotExist:
-            messages.error(request, 'Account not found.')
-            return redirect('dashboard')
+    except Account.DoesNotExist:
+        messages.error(request, 'Account not found.')
+        return redirect('dashboard')
     
     transactions = account.transactions.all()
     